@@ -5,19 +5,77 @@ Track prices from e-commerce sites with historical data, trends, and alerts.
 """
 
 import argparse
+import asyncio
 import json
 import os
 import sys
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
-import requests
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+import aiohttp
 from bs4 import BeautifulSoup
+from lxml import etree
 import re
 
+# orjson is much faster for large price histories; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Configuration
 DATA_FILE = "tracked_products.json"
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+REQUEST_TIMEOUT = 10  # seconds per product page
+MAX_PER_HOST = 2  # concurrent connections per site, avoids rate limiting
+REQUEST_DELAY = 1.0  # seconds between requests to the same site during a check
+MAX_CONNECTIONS = 50
+KEEPALIVE_TIMEOUT = 30  # seconds to keep idle connections for reuse
+DNS_CACHE_TTL = 300  # seconds to cache resolved hostnames
+MAX_CANDIDATES = 5  # elements tried per selector before moving on
+STREAM_CHUNK_SIZE = 16384  # bytes read per chunk when streaming a page
+
+# Price extraction patterns, built once at import time
+_PRICE_RE = re.compile(r'(\d+\.?\d*)')
+# Drops currency symbols and thousands separators; whitespace becomes a space so separate numbers stay apart
+_STRIP_TABLE = str.maketrans('\t\n\r', '   ', '$£€,')
+
+# Amazon price selectors (they change frequently)
+_AMAZON_SELECTORS = (
+    'span.a-price-whole',
+    'span.a-offscreen',
+    'span#priceblock_ourprice',
+    'span#priceblock_dealprice',
+    'span.a-color-price',
+)
+
+# Common price selectors
+_GENERIC_SELECTORS = (
+    '[class*="price"]',
+    '[id*="price"]',
+    '[class*="Price"]',
+    'span.price',
+    'div.price',
+    'p.price',
+)
+
+
+def _json_loads(data):
+    """Deserialize JSON with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = False) -> str:
+    """Serialize JSON with orjson when available, keeping non-ASCII text as-is."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
 
 # Colors and formatting (basic ANSI codes for cross-platform support)
 class Colors:
@@ -56,23 +114,76 @@ except:
 class PriceTracker:
     def __init__(self, data_file: str = DATA_FILE):
         self.data_file = data_file
+        # Price entries are appended to a JSONL log next to the product file
+        self.history_file = os.path.splitext(data_file)[0] + "_history.jsonl"
+        self._pending_entries: List[Dict] = []
         self.products = self._load_data()
 
     def _load_data(self) -> Dict:
-        """Load tracked products from JSON file."""
+        """Load tracked products from JSON file and their price history from JSONL."""
+        products = {}
         if os.path.exists(self.data_file):
             try:
                 with open(self.data_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    products = _json_loads(f.read())
             except json.JSONDecodeError:
                 print(f"Warning: {self.data_file} is corrupted. Starting fresh.")
                 return {}
-        return {}
+
+        # History is held as parallel timestamp/price lists rather than a list of entry dicts
+        for name, product in products.items():
+            # Older files keep history inline; queue it so the next save moves it to the log
+            legacy_prices = product.get("prices", [])
+            product["timestamps"] = []
+            for entry in legacy_prices:
+                ts = self._entry_timestamp(entry)
+                self._pending_entries.append({"name": name, **entry, "ts": ts})
+                product["timestamps"].append(ts)
+            product["prices"] = [entry["price"] for entry in legacy_prices]
+
+        if os.path.exists(self.history_file):
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = _json_loads(line)
+                    except json.JSONDecodeError:
+                        continue  # skip blank or partially written lines
+                    product = products.get(entry.get("name"))
+                    if product is not None:
+                        product["timestamps"].append(self._entry_timestamp(entry))
+                        product["prices"].append(entry["price"])
+
+        # Derived from the log on every load so they can never disagree with it
+        for product in products.values():
+            prices = product["prices"]
+            product["latest_price"] = prices[-1] if prices else None
+            product["previous_price"] = prices[-2] if len(prices) > 1 else None
+            product["trend"] = self._calculate_trend(prices)
+
+        return products
+
+    def _entry_timestamp(self, entry: Dict) -> int:
+        """Return epoch seconds for a history entry; older entries only have an ISO date."""
+        if "ts" in entry:
+            return entry["ts"]
+        return int(datetime.fromisoformat(entry["date"]).timestamp())
 
     def _save_data(self):
-        """Save tracked products to JSON file."""
+        """Append new price entries to the history log and save product metadata."""
+        if self._pending_entries:
+            with open(self.history_file, 'a', encoding='utf-8') as f:
+                for entry in self._pending_entries:
+                    f.write(_json_dumps(entry) + "\n")
+            self._pending_entries = []
+
+        # History and the fields derived from it are rebuilt from the log on load
+        derived = ("timestamps", "prices", "latest_price", "previous_price", "trend")
+        metadata = {
+            name: {key: value for key, value in product.items() if key not in derived}
+            for name, product in self.products.items()
+        }
         with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(self.products, f, indent=2, ensure_ascii=False)
+            f.write(_json_dumps(metadata, indent=True))
 
     def add_product(self, url: str, name: str) -> bool:
         """Add a new product to track."""
@@ -80,18 +191,21 @@ class PriceTracker:
             print(f"Error: Product '{name}' already exists.")
             return False
 
-        # Try to fetch initial price
+        product = {
+            "name": name,
+            "url": url,
+            "timestamps": [],
+            "prices": []
+        }
+
+        # Try to fetch initial price; the fetch also stores the page's ETag/Last-Modified
         print(f"Adding product '{name}'...")
-        price = self._scrape_price(url)
+        price = self._scrape_price(url, product)
 
         if price is None:
             print(f"Warning: Could not fetch initial price, but product will be added.")
 
-        self.products[name] = {
-            "name": name,
-            "url": url,
-            "prices": []
-        }
+        self.products[name] = product
 
         # Add initial price if available
         if price is not None:
@@ -105,71 +219,144 @@ class PriceTracker:
 
     def _add_price_entry(self, name: str, price: float):
         """Add a price entry with timestamp to a product."""
-        timestamp = datetime.now().isoformat()
-        self.products[name]["prices"].append({
-            "date": timestamp,
-            "price": price
-        })
-
-    def _scrape_price(self, url: str) -> Optional[float]:
+        now = datetime.now()
+        timestamp = now.isoformat()
+        ts = int(now.timestamp())
+        product = self.products[name]
+        self._update_stats(product, price)
+        product["timestamps"].append(ts)
+        product["prices"].append(price)
+        product["previous_price"] = product.get("latest_price")
+        product["latest_price"] = price
+        product["trend"] = self._calculate_trend(product["prices"])
+        # ISO date keeps the log readable; ts lets display skip date parsing
+        self._pending_entries.append({"name": name, "date": timestamp, "ts": ts, "price": price})
+
+    def _scrape_price(self, url: str, product: Optional[Dict] = None) -> Optional[float]:
         """Scrape price from URL. Supports Amazon and general e-commerce sites."""
+        async def _run():
+            async with self._create_session() as session:
+                return await self._scrape_price_async(session, url, product)
+
+        price, error = asyncio.run(_run())
+        if error:
+            print(error)
+        return price
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session with browser headers, pooled connections and DNS caching."""
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONNECTIONS,
+            limit_per_host=MAX_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            use_dns_cache=True,
+            ttl_dns_cache=DNS_CACHE_TTL
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        )
+
+    async def _scrape_price_async(self, session: aiohttp.ClientSession, url: str,
+                                  product: Optional[Dict] = None) -> Tuple[Optional[float], Optional[str]]:
+        """Fetch a product page on a shared session and extract its price.
+
+        Returns (price, error). Errors are returned rather than printed so
+        callers can report them next to the product they belong to.
+
+        For a tracked product the request is conditional on the cached
+        ETag/Last-Modified; an unchanged page (304) reuses the latest price.
+        """
         try:
-            headers = {"User-Agent": USER_AGENT}
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+            headers = {}
+            if product is not None:
+                if product.get("etag"):
+                    headers["If-None-Match"] = product["etag"]
+                if product.get("last_modified"):
+                    headers["If-Modified-Since"] = product["last_modified"]
+
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and product is not None:
+                    return product.get("latest_price"), None
+                response.raise_for_status()
+                validators = response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+                if "amazon" in url.lower():
+                    # Price sits near the top of the page; stop downloading once found
+                    price, content = await self._stream_amazon_price(response)
+                else:
+                    price, content = None, await response.read()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if price is None:
+                # Parse in a worker thread so other downloads keep progressing meanwhile
+                loop = asyncio.get_running_loop()
+                price = await loop.run_in_executor(None, self._parse_price, content, url)
 
-            # Try different selectors based on site
-            if "amazon" in url.lower():
-                return self._scrape_amazon(soup)
-            else:
-                return self._scrape_generic(soup)
+            # Only cache validators for pages that yielded a price
+            if price is not None and product is not None:
+                product["etag"], product["last_modified"] = validators
+            return price, None
 
-        except requests.RequestException as e:
-            print(f"Error fetching URL: {e}")
-            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Timeouts have an empty message, so fall back to the exception repr
+            return None, f"Error fetching {url}: {str(e) or repr(e)}"
         except Exception as e:
-            print(f"Error parsing price: {e}")
-            return None
+            return None, f"Error parsing price from {url}: {str(e) or repr(e)}"
 
-    def _scrape_amazon(self, soup: BeautifulSoup) -> Optional[float]:
-        """Extract price from Amazon product page."""
-        # Amazon price selectors (they change frequently)
-        selectors = [
-            'span.a-price-whole',
-            'span.a-offscreen',
-            'span#priceblock_ourprice',
-            'span#priceblock_dealprice',
-            'span.a-color-price',
-        ]
+    async def _stream_amazon_price(self, response: aiohttp.ClientResponse) -> Tuple[Optional[float], bytes]:
+        """Parse an Amazon page while it downloads.
 
-        for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                price_text = element.get_text().strip()
-                price = self._extract_price_from_text(price_text)
-                if price is not None:
-                    return price
+        Returns (price, b'') as soon as a price span is complete, leaving the
+        rest of the body unread. Otherwise returns (None, content) with the
+        full page for the regular selector fallback.
 
-        return None
+        Abandoning the body makes aiohttp close the connection rather than
+        pool it, so the next request to the host pays a new TCP+TLS handshake.
+        That is cheap next to the 0.5-2 MB of page it avoids downloading,
+        especially with requests to a host already REQUEST_DELAY apart.
+        """
+        parser = etree.HTMLPullParser(events=('end',), tag='span')
+        chunks = []
+
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                if 'a-price-whole' in element.get('class', '').split():
+                    price = self._extract_price_from_text(''.join(element.itertext()))
+                    if price is not None:
+                        return price, b''
+
+        return None, b''.join(chunks)
+
+    def _parse_price(self, content: bytes, url: str) -> Optional[float]:
+        """Parse downloaded page content and extract the price."""
+        soup = BeautifulSoup(content, 'lxml')
+
+        # Try different selectors based on site
+        if "amazon" in url.lower():
+            return self._scrape_amazon(soup)
+        else:
+            return self._scrape_generic(soup)
+
+    def _scrape_amazon(self, soup: BeautifulSoup) -> Optional[float]:
+        """Extract price from Amazon product page."""
+        return self._find_price(soup, _AMAZON_SELECTORS)
 
     def _scrape_generic(self, soup: BeautifulSoup) -> Optional[float]:
         """Extract price from generic e-commerce site."""
-        # Common price selectors
-        selectors = [
-            '[class*="price"]',
-            '[id*="price"]',
-            '[class*="Price"]',
-            'span.price',
-            'div.price',
-            'p.price',
-        ]
+        return self._find_price(soup, _GENERIC_SELECTORS)
 
+    def _find_price(self, soup: BeautifulSoup, selectors: Tuple[str, ...]) -> Optional[float]:
+        """Return the first parseable price, trying selectors in priority order."""
         for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                price_text = element.get_text().strip()
+            # iselect matches lazily, so the tree walk stops at the first hit
+            for element in soup.css.iselect(selector, limit=MAX_CANDIDATES):
+                # Leaf price spans expose their text directly; nested markup needs get_text
+                price_text = element.string
+                if price_text is None:
+                    price_text = element.get_text(strip=True)
                 price = self._extract_price_from_text(price_text)
                 if price is not None:
                     return price
@@ -178,12 +365,11 @@ class PriceTracker:
 
     def _extract_price_from_text(self, text: str) -> Optional[float]:
         """Extract numeric price from text string."""
-        # Remove common currency symbols and clean text
-        text = text.replace('$', '').replace('£', '').replace('€', '')
-        text = text.replace(',', '').strip()
+        # Remove currency symbols and separators and normalize whitespace in a single pass
+        text = text.translate(_STRIP_TABLE).strip()
 
         # Find price pattern (e.g., 123.45 or 123)
-        match = re.search(r'(\d+\.?\d*)', text)
+        match = _PRICE_RE.search(text)
         if match:
             try:
                 return float(match.group(1))
@@ -201,16 +387,41 @@ class PriceTracker:
         print(f"Checking {len(self.products)} product(s)...")
         updated = 0
 
+        # Fetch all pages concurrently; state updates and output stay sequential
+        async def _run():
+            # One queue per site: each is worked through politely in order,
+            # while different sites are checked in parallel
+            queues = {}
+            for name, product in self.products.items():
+                queues.setdefault(urlparse(product["url"]).netloc, []).append(name)
+            results = {}
+
+            async def _worker(session, names):
+                for i, name in enumerate(names):
+                    if i > 0:
+                        await asyncio.sleep(REQUEST_DELAY)
+                    product = self.products[name]
+                    results[name] = await self._scrape_price_async(session, product["url"], product)
+
+            async with self._create_session() as session:
+                await asyncio.gather(*[_worker(session, names) for names in queues.values()])
+            return results
+
+        results = asyncio.run(_run())
+
         for name, product in self.products.items():
             print(f"\nChecking '{name}'...")
-            price = self._scrape_price(product["url"])
+            price, error = results.get(name, (None, None))
+            if error:
+                print(f"  {error}")
 
             if price is not None:
                 self._add_price_entry(name, price)
+                self._get_stats(product)  # refresh so the saved summary is current
 
                 # Show price change if we have previous data
-                if len(product["prices"]) > 1:
-                    old_price = product["prices"][-2]["price"]
+                old_price = product["previous_price"]
+                if old_price is not None:
                     change = price - old_price
                     change_pct = (change / old_price) * 100
 
@@ -244,10 +455,10 @@ class PriceTracker:
 
         for name, product in self.products.items():
             if product["prices"]:
-                latest_price = product["prices"][-1]["price"]
+                latest_price = product["latest_price"]
                 price_str = f"${latest_price:.2f}"
                 entries = len(product["prices"])
-                trend = self._calculate_trend(product["prices"])
+                trend = product["trend"]
 
                 # Color code the trend
                 if trend == "Rising":
@@ -286,12 +497,12 @@ class PriceTracker:
         print(f"{'Date':<25} {'Price':<15} {'Change':<15}")
         print("-" * 60)
 
-        for i, entry in enumerate(product["prices"]):
-            date_str = datetime.fromisoformat(entry["date"]).strftime("%Y-%m-%d %H:%M:%S")
-            price = entry["price"]
+        prices = product["prices"]
+        for i, (ts, price) in enumerate(zip(product["timestamps"], prices)):
+            date_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
 
             if i > 0:
-                prev_price = product["prices"][i-1]["price"]
+                prev_price = prices[i-1]
                 change = price - prev_price
                 change_pct = (change / prev_price) * 100
 
@@ -308,25 +519,25 @@ class PriceTracker:
 
         # Show summary
         print("\n" + "=" * 60)
-        trend = self._calculate_trend(product["prices"])
+        trend = product["trend"]
         print(f"Trend: {trend}")
 
-        if len(product["prices"]) >= 2:
-            first_price = product["prices"][0]["price"]
-            latest_price = product["prices"][-1]["price"]
+        if len(prices) >= 2:
+            first_price = prices[0]
+            latest_price = prices[-1]
             total_change = latest_price - first_price
             total_change_pct = (total_change / first_price) * 100
 
             print(f"Overall Change: ${total_change:+.2f} ({total_change_pct:+.1f}%)")
 
-    def _calculate_trend(self, prices: List[Dict]) -> str:
+    def _calculate_trend(self, prices: List[float]) -> str:
         """Calculate trend from price history."""
         if len(prices) < 2:
             return "Insufficient data"
 
         # Calculate trend over last 3 entries (or all if less)
         window = min(3, len(prices))
-        recent_prices = [p["price"] for p in prices[-window:]]
+        recent_prices = prices[-window:]
 
         # Check if prices are rising, falling, or stable
         increases = sum(1 for i in range(1, len(recent_prices)) if recent_prices[i] > recent_prices[i-1])
@@ -371,27 +582,24 @@ class PriceTracker:
             print(f"  {Colors.YELLOW}No price data available{Colors.END}\n")
             return
 
-        prices = [p["price"] for p in product["prices"]]
-        first_price = prices[0]
-        latest_price = prices[-1]
-        min_price = min(prices)
-        max_price = max(prices)
-        avg_price = sum(prices) / len(prices)
+        stats = self._get_stats(product)
+        first_price = product["prices"][0]
+        latest_price = product["prices"][-1]
+        min_price = stats["min"]
+        max_price = stats["max"]
+        avg_price = stats["mean"]
 
         # Calculate changes
         total_change = latest_price - first_price
         total_change_pct = (total_change / first_price) * 100 if first_price != 0 else 0
 
         # Find best and worst prices with dates
-        min_idx = prices.index(min_price)
-        max_idx = prices.index(max_price)
-        min_date = datetime.fromisoformat(product["prices"][min_idx]["date"]).strftime("%Y-%m-%d")
-        max_date = datetime.fromisoformat(product["prices"][max_idx]["date"]).strftime("%Y-%m-%d")
-
-        # Calculate volatility (standard deviation)
-        if len(prices) > 1:
-            variance = sum((p - avg_price) ** 2 for p in prices) / len(prices)
-            volatility = variance ** 0.5
+        min_date = time.strftime("%Y-%m-%d", time.localtime(product["timestamps"][stats["min_idx"]]))
+        max_date = time.strftime("%Y-%m-%d", time.localtime(product["timestamps"][stats["max_idx"]]))
+
+        # Calculate volatility (population standard deviation)
+        if stats["count"] > 1:
+            volatility = (stats["m2"] / stats["count"]) ** 0.5
             volatility_pct = (volatility / avg_price) * 100 if avg_price != 0 else 0
         else:
             volatility_pct = 0
@@ -409,16 +617,68 @@ class PriceTracker:
         print(f"    Spread:   ${max_price - min_price:.2f} ({((max_price - min_price) / min_price * 100):.1f}%)")
 
         print(f"\n  {Colors.BOLD}Statistics:{Colors.END}")
-        print(f"    Data Points:  {len(prices)}")
+        print(f"    Data Points:  {stats['count']}")
         print(f"    Volatility:   {volatility_pct:.1f}%")
-        print(f"    Trend:        {self._format_trend(self._calculate_trend(product['prices']))}")
+        print(f"    Trend:        {self._format_trend(product['trend'])}")
 
         # First and last recorded dates
-        first_date = datetime.fromisoformat(product["prices"][0]["date"]).strftime("%Y-%m-%d %H:%M")
-        last_date = datetime.fromisoformat(product["prices"][-1]["date"]).strftime("%Y-%m-%d %H:%M")
+        first_date = time.strftime("%Y-%m-%d %H:%M", time.localtime(product["timestamps"][0]))
+        last_date = time.strftime("%Y-%m-%d %H:%M", time.localtime(product["timestamps"][-1]))
         print(f"    First Check:  {first_date}")
         print(f"    Last Check:   {last_date}")
 
+    def _get_stats(self, product: Dict) -> Dict:
+        """Return summary statistics, recomputing only when they are missing or stale."""
+        stats = product.get("stats")
+        if stats is None or stats["count"] != len(product["prices"]):
+            stats = self._compute_stats(product["prices"])
+            product["stats"] = stats  # saved with the product metadata
+        return stats
+
+    def _compute_stats(self, price_list: List[float]) -> Dict:
+        """Compute the running summary from a full price history."""
+        # Only needed to rebuild missing or stale stats, so keep it off the startup path
+        import numpy as np
+
+        prices = np.asarray(price_list, dtype=np.float64)
+        mean = float(prices.mean())
+        return {
+            "count": len(prices),
+            "min": float(prices.min()),
+            "max": float(prices.max()),
+            "mean": mean,
+            "m2": float(((prices - mean) ** 2).sum()),
+            "min_idx": int(prices.argmin()),
+            "max_idx": int(prices.argmax())
+        }
+
+    def _update_stats(self, product: Dict, price: float):
+        """Fold a new price into the running summary using Welford's algorithm."""
+        count = len(product["prices"])
+        if count == 0:
+            product["stats"] = {
+                "count": 1, "min": price, "max": price, "mean": price,
+                "m2": 0.0, "min_idx": 0, "max_idx": 0
+            }
+            return
+
+        stats = product.get("stats")
+        if stats is None or stats["count"] != count:
+            return  # rebuilt from the full history by _get_stats when needed
+
+        stats["count"] = count + 1
+        delta = price - stats["mean"]
+        stats["mean"] += delta / stats["count"]
+        stats["m2"] += delta * (price - stats["mean"])
+
+        # Strict comparisons keep the earliest date for repeated extremes
+        if price < stats["min"]:
+            stats["min"] = price
+            stats["min_idx"] = count
+        if price > stats["max"]:
+            stats["max"] = price
+            stats["max_idx"] = count
+
     def _format_trend(self, trend: str) -> str:
         """Format trend with color."""
         if trend == "Rising":
@@ -438,12 +698,11 @@ class PriceTracker:
         alerts = []
 
         for name, product in self.products.items():
-            if len(product["prices"]) < 2:
+            previous_price = product.get("previous_price")
+            if previous_price is None:
                 continue
 
-            latest_price = product["prices"][-1]["price"]
-            previous_price = product["prices"][-2]["price"]
-
+            latest_price = product["latest_price"]
             drop = ((previous_price - latest_price) / previous_price) * 100
 
             if drop >= drop_threshold:
@@ -522,7 +781,7 @@ def show_help():
   - Schedule 'check' command daily for best results
   - Green = falling prices (good for buying!)
   - Red = rising prices (missed opportunity?)
-  - Data stored in: {Colors.YELLOW}tracked_products.json{Colors.END}
+  - Data stored in: {Colors.YELLOW}tracked_products.json{Colors.END} (price log: {Colors.YELLOW}tracked_products_history.jsonl{Colors.END})
 
 {Colors.BOLD}{Colors.HEADER}{'='*80}{Colors.END}
 """